@@ -4,12 +4,98 @@ Configuration system for the Universal Markdown Audio Transcription System
 Supports JSON and YAML configuration files with validation and defaults.
 """
 
+import copy
+import functools
+import hashlib
 import json
 import os
-import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable
 import logging
+import stat
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .fileio import atomic_write_bytes
+
+# PyYAML is imported on first use so JSON-only setups never pay its import cost
+_yaml_loader = None
+_yaml_dumper = None
+
+def _yaml_load(data: bytes):
+    """Parse YAML using the libyaml loader when PyYAML was built with it"""
+    global _yaml_loader
+    import yaml
+    if _yaml_loader is None:
+        _yaml_loader = getattr(yaml, "CSafeLoader", None)
+        if _yaml_loader is None:
+            import warnings
+            warnings.warn("PyYAML was built without libyaml; falling back to the slower pure-Python "
+                          "YAML loader (install libyaml-dev and reinstall PyYAML to fix)")
+            _yaml_loader = yaml.SafeLoader
+    return yaml.load(data, Loader=_yaml_loader)
+
+def _yaml_dump(data: Dict[str, Any]) -> bytes:
+    """Serialize YAML using the pure-Python SafeDumper
+
+    libyaml's emitter escapes characters outside the BMP (e.g. the default
+    emoji link prefix), so it is not used for writing configs.
+    """
+    global _yaml_dumper
+    import yaml
+    if _yaml_dumper is None:
+        # Default extension lists are tuples; write them as plain YAML lists
+        _yaml_dumper = type("_ConfigDumper", (yaml.SafeDumper,), {})
+        _yaml_dumper.add_representer(tuple, yaml.SafeDumper.represent_list)
+    return yaml.dump(data, Dumper=_yaml_dumper, default_flow_style=False, allow_unicode=True,
+                     encoding="utf-8")
+
+def _json_dump(data: Dict[str, Any]) -> bytes:
+    """Serialize JSON keeping non-ASCII characters readable (uses orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Parsers (taking the raw file bytes) and serializers by (lowercase) config file suffix
+_LOADERS: Dict[str, Callable[[bytes], Any]] = {
+    ".json": orjson.loads if orjson is not None else json.loads,
+    ".yaml": _yaml_load,
+    ".yml": _yaml_load,
+}
+_DUMPERS: Dict[str, Callable[[Dict[str, Any]], bytes]] = {
+    ".json": _json_dump,
+    ".yaml": _yaml_dump,
+    ".yml": _yaml_dump,
+}
+
+def _format_handler(handlers: Dict[str, Callable], config_file: Path) -> Callable:
+    """Look up the loader/dumper for a config file based on its suffix"""
+    handler = handlers.get(config_file.suffix.lower())
+    if handler is None:
+        raise ConfigurationError(f"Unsupported configuration file format: {config_file.suffix}")
+    return handler
+
+def _yaml_errors() -> Tuple[type, ...]:
+    """Get PyYAML's base exception type as a tuple, empty if PyYAML isn't imported
+
+    Only a YAML file that was actually parsed can raise a YAML error, so this
+    never imports PyYAML (or fails without it) while handling other errors.
+    """
+    yaml = sys.modules.get("yaml")
+    return (yaml.YAMLError,) if yaml is not None else ()
+
+# Parsed config files keyed by resolved path -> (mtime_ns, size, parsed dict)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Bump when the layout of the on-disk config sidecar changes
+_SIDECAR_VERSION = 2
+
+# Relative template paths are resolved against the project root
+_PROJECT_DIR = Path(__file__).parent.parent
 
 class ConfigurationError(Exception):
     """Custom exception for configuration errors"""
@@ -20,7 +106,7 @@ class ConfigManager:
     
     DEFAULT_CONFIG = {
         # Paths
-        "vault_path": str(Path.home() / "Notes"),
+        "vault_path": None,  # Filled in with ~/Notes on construction
         "audio_folder_name": "Audio",
         "transcripts_folder_name": "Audio-Transcripts",
         "temp_dir": "/tmp",
@@ -32,6 +118,9 @@ class ConfigManager:
         # Whisper settings
         "whisper_model": "medium",
         "language": "de",
+        "backend": "whisper",  # whisper, faster-whisper
+        "device": "auto",  # faster-whisper only: auto, cpu, cuda
+        "compute_type": "int8",  # faster-whisper only: int8, float16, float32, ...
         
         # System settings
         "log_file": "/var/log/markdown-transcription.log",
@@ -40,9 +129,9 @@ class ConfigManager:
         "owner_group": None,
         "encoding": "utf-8",
         
-        # File extensions
-        "audio_extensions": [".mp3", ".wav", ".m4a", ".flac", ".ogg", ".aac", ".wma"],
-        "video_extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"],
+        # File extensions (tuples so copies of the defaults never share mutable state)
+        "audio_extensions": (".mp3", ".wav", ".m4a", ".flac", ".ogg", ".aac", ".wma"),
+        "video_extensions": (".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"),
         
         # Link format customization
         "link_format_prefix": "📝 **Transcript:**",
@@ -53,6 +142,7 @@ class ConfigManager:
         "create_timestamps": True,
         "skip_existing_transcripts": True,
         "recursive_search": True,
+        "parallel_workers": 1,  # Files transcribed concurrently; each worker loads its own model
         
         # Logging
         "log_level": "INFO",
@@ -60,33 +150,86 @@ class ConfigManager:
         "file_logging": True
     }
     
+    # Keys the cached vault/audio/transcripts paths are derived from
+    _PATH_KEYS = frozenset({"vault_path", "audio_folder_name", "transcripts_folder_name"})
+    # Keys the bound link formatter is derived from
+    _LINK_KEYS = frozenset({"link_format_style", "link_format_prefix", "link_template_path"})
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration manager"""
         self.config_path = config_path
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = dict(self.DEFAULT_CONFIG)
+        if self.config["vault_path"] is None:
+            self.config["vault_path"] = self._default_vault_path()
         self.logger = logging.getLogger(__name__)
+        self._vault_path: Optional[Path] = None
+        self._audio_folder: Optional[Path] = None
+        self._transcripts_folder: Optional[Path] = None
+        self._extensions: Optional[Tuple[str, ...]] = None
+        self._extension_set: frozenset = frozenset()
+        # Template path -> (mtime_ns, content)
+        self._template_cache: Dict[str, Tuple[int, str]] = {}
+        self._link_formatter: Optional[Callable[[str], str]] = None
         
         if config_path:
             self.load_config(config_path)
     
+    @classmethod
+    def get_instance(cls, config_path: Optional[str] = None) -> "ConfigManager":
+        """Get a shared configuration manager for a config file
+        
+        Instances are cached per resolved path and file mtime, so callers share
+        one parsed and validated config until the file changes on disk. The
+        returned object is shared and should be treated as read-only; use the
+        constructor for a private copy that can be modified with set().
+        """
+        if config_path is None:
+            return cls._cached_instance(None, 0)
+        
+        config_file = Path(config_path).resolve()
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except FileNotFoundError as e:
+            raise ConfigurationError(f"Configuration file not found: {config_path}") from e
+        return cls._cached_instance(str(config_file), mtime_ns)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _cached_instance(cls, config_path: Optional[str], mtime_ns: int) -> "ConfigManager":
+        """Create the instance backing get_instance (mtime_ns is only part of the cache key)"""
+        return cls(config_path)
+    
+    @staticmethod
+    def _default_vault_path() -> str:
+        """Get the default vault path (evaluated lazily so $HOME can change after import)"""
+        return str(Path.home() / "Notes")
+    
     def load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from file"""
         config_file = Path(config_path)
         
-        if not config_file.exists():
-            raise ConfigurationError(f"Configuration file not found: {config_path}")
-        
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                if config_file.suffix.lower() == '.json':
-                    user_config = json.load(f)
-                elif config_file.suffix.lower() in ['.yaml', '.yml']:
-                    user_config = yaml.safe_load(f)
-                else:
-                    raise ConfigurationError(f"Unsupported configuration file format: {config_file.suffix}")
+            # Reuse the parsed file if it hasn't changed since the last load
+            st = config_file.stat()
+            cache_key = str(config_file.resolve())
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                user_config = copy.deepcopy(cached[2])
+            else:
+                user_config = self._read_config_sidecar(config_file, st)
+                if user_config is None:
+                    loader = _format_handler(_LOADERS, config_file)
+                    user_config = loader(config_file.read_bytes())
+                    self._write_config_sidecar(config_file, st, user_config)
+                _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(user_config))
             
-            # Merge with defaults
-            self.config.update(user_config)
+            # Merge with defaults - only known keys, so typos don't silently become new settings
+            unknown_keys = [key for key in user_config if key not in self.DEFAULT_CONFIG]
+            if unknown_keys:
+                import warnings
+                warnings.warn(f"Ignoring unknown configuration keys in {config_path}: {', '.join(unknown_keys)}")
+            self.config.update((key, value) for key, value in user_config.items() if key in self.DEFAULT_CONFIG)
+            self._clear_derived()
             
             # Validate configuration
             self._validate_config()
@@ -97,51 +240,149 @@ class ConfigManager:
             self.logger.info(f"Configuration loaded from {config_path}")
             return self.config
             
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
+        except FileNotFoundError as e:
+            raise ConfigurationError(f"Configuration file not found: {config_path}") from e
+        except (json.JSONDecodeError, *_yaml_errors()) as e:
             raise ConfigurationError(f"Invalid configuration file format: {e}")
         except Exception as e:
             raise ConfigurationError(f"Error loading configuration: {e}")
     
+    @staticmethod
+    def _sidecar_path(config_file: Path) -> Path:
+        """Get path of the parsed-config sidecar in the per-user cache directory"""
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        digest = hashlib.sha256(os.fsencode(config_file.resolve())).hexdigest()
+        return Path(cache_home) / "markdown-transcription" / "configs" / f"{digest}.json"
+    
+    def _read_config_sidecar(self, config_file: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Load the parsed config from its sidecar if it matches the source file"""
+        # JSON configs parse as fast as the sidecar itself
+        if config_file.suffix.lower() == ".json":
+            return None
+        try:
+            with open(self._sidecar_path(config_file), 'rb') as f:
+                # Only trust caches nobody else could have written
+                sidecar_st = os.fstat(f.fileno())
+                if sidecar_st.st_uid != os.geteuid() or sidecar_st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    self.logger.warning(f"Ignoring config cache for {config_file}: "
+                                        f"not owned by the current user or writable by others")
+                    return None
+                data = _LOADERS[".json"](f.read())
+            if (data["version"] == _SIDECAR_VERSION
+                    and data["path"] == str(config_file.resolve())
+                    and data["mtime_ns"] == st.st_mtime_ns
+                    and data["size"] == st.st_size):
+                return data["config"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable config cache for {config_file}: {e}")
+        return None
+    
+    def _write_config_sidecar(self, config_file: Path, st: os.stat_result, user_config: Dict[str, Any]):
+        """Store the parsed config in a sidecar so later runs can skip parsing"""
+        if config_file.suffix.lower() == ".json":
+            return
+        data = {
+            "version": _SIDECAR_VERSION,
+            "path": str(config_file.resolve()),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "config": user_config,
+        }
+        try:
+            payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            # YAML values without a JSON equivalent (e.g. dates) aren't cached
+            if json.loads(payload)["config"] != user_config:
+                return
+            sidecar_path = self._sidecar_path(config_file)
+            sidecar_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            atomic_write_bytes(sidecar_path, payload, fsync=False, mode=0o600)
+        except Exception as e:
+            self.logger.debug(f"Could not write config cache for {config_file}: {e}")
+    
     def _validate_config(self):
         """Validate configuration values"""
+        cfg = self.config
+        
         # Validate paths - but only warn if they don't exist, don't fail
-        vault_path = Path(self.config["vault_path"])
+        vault_path = Path(cfg["vault_path"])
         if not vault_path.exists():
             # Only raise error if this is not a default path
-            if str(vault_path) != str(Path.home() / "Notes"):
+            if str(vault_path) != self._default_vault_path():
                 import warnings
                 warnings.warn(f"Vault path does not exist: {vault_path}")
         
         # Validate whisper model
-        valid_models = ["tiny", "base", "small", "medium", "large", "large-v2", "large-v3"]
-        if self.config["whisper_model"] not in valid_models:
-            raise ConfigurationError(f"Invalid whisper model: {self.config['whisper_model']}")
+        valid_models = ("tiny", "base", "small", "medium", "large", "large-v2", "large-v3")
+        model = cfg["whisper_model"]
+        if model not in valid_models:
+            raise ConfigurationError(f"Invalid whisper model: {model}")
+        
+        # Validate transcription backend
+        valid_backends = ("whisper", "faster-whisper")
+        backend = cfg["backend"]
+        if backend not in valid_backends:
+            raise ConfigurationError(f"Invalid transcription backend: {backend}")
         
         # Validate link format style
-        valid_styles = ["wikilink", "standard", "custom"]
-        if self.config["link_format_style"] not in valid_styles:
-            raise ConfigurationError(f"Invalid link format style: {self.config['link_format_style']}")
+        valid_styles = ("wikilink", "standard", "custom")
+        link_style = cfg["link_format_style"]
+        if link_style not in valid_styles:
+            raise ConfigurationError(f"Invalid link format style: {link_style}")
         
         # Validate log level
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.config["log_level"] not in valid_levels:
-            raise ConfigurationError(f"Invalid log level: {self.config['log_level']}")
+        valid_levels = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+        log_level = cfg["log_level"]
+        if log_level not in valid_levels:
+            raise ConfigurationError(f"Invalid log level: {log_level}")
         
-        # Validate extensions
-        if not self.config["audio_extensions"] and not self.config["video_extensions"]:
+        # Validate worker count
+        workers = cfg["parallel_workers"]
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            raise ConfigurationError(f"Invalid parallel workers: {workers}")
+        
+        # Validate extensions (normalized once so lookups never need to re-case them)
+        for ext_key in ("audio_extensions", "video_extensions"):
+            cfg[ext_key] = self._normalize_extensions(cfg[ext_key] or [])
+        if not cfg["audio_extensions"] and not cfg["video_extensions"]:
             raise ConfigurationError("At least one audio or video extension must be specified")
     
+    @staticmethod
+    def _normalize_extensions(extensions: List[str]) -> List[str]:
+        """Lowercase extensions, ensure a leading dot and drop duplicates (keeping order)"""
+        normalized = []
+        for ext in extensions:
+            ext = str(ext).strip().lower()
+            if ext:
+                normalized.append(ext if ext.startswith(".") else f".{ext}")
+        return list(dict.fromkeys(normalized))
+    
     def _expand_paths(self):
         """Expand relative paths to absolute paths"""
         # Expand vault path
         self.config["vault_path"] = str(Path(self.config["vault_path"]).expanduser().resolve())
         
-        # Expand template paths relative to script location
-        script_dir = Path(__file__).parent.parent
-        for template_key in ["transcript_template_path", "link_template_path"]:
+        # Expand template paths relative to script location (joined, not resolved,
+        # so no symlink lookups are needed)
+        for template_key in ("transcript_template_path", "link_template_path"):
             template_path = Path(self.config[template_key])
             if not template_path.is_absolute():
-                self.config[template_key] = str(script_dir / template_path)
+                self.config[template_key] = str(_PROJECT_DIR / template_path)
+        
+        self._cache_paths()
+    
+    def _clear_derived(self):
+        """Drop values derived from the config so they are rebuilt on next use"""
+        self._vault_path = None
+        self._extensions = None
+        self._link_formatter = None
+    
+    def _cache_paths(self):
+        """Build the vault/audio/transcripts Path objects once"""
+        self._vault_path = Path(self.config["vault_path"])
+        self._audio_folder = self._vault_path / self.config["audio_folder_name"]
+        self._transcripts_folder = self._vault_path / self.config["transcripts_folder_name"]
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
@@ -150,67 +391,114 @@ class ConfigManager:
     def set(self, key: str, value: Any):
         """Set configuration value"""
         self.config[key] = value
+        if key in self._PATH_KEYS:
+            self._vault_path = None
+        elif key.endswith("_extensions"):
+            self._extensions = None
+        elif key in self._LINK_KEYS:
+            self._link_formatter = None
     
-    def get_supported_extensions(self) -> List[str]:
+    def _cache_extensions(self):
+        """Build the supported extension tuple and its lowercase lookup set once"""
+        self._extensions = tuple(self.config["audio_extensions"]) + tuple(self.config["video_extensions"])
+        self._extension_set = frozenset(ext.lower() for ext in self._extensions)
+    
+    def get_supported_extensions(self) -> Tuple[str, ...]:
         """Get all supported file extensions"""
-        return self.config["audio_extensions"] + self.config["video_extensions"]
+        if self._extensions is None:
+            self._cache_extensions()
+        return self._extensions
+    
+    def is_supported_extension(self, ext: str) -> bool:
+        """Check whether a file suffix (e.g. ".MP3") is a supported media extension"""
+        if self._extensions is None:
+            self._cache_extensions()
+        return ext.lower() in self._extension_set
     
     def get_vault_path(self) -> Path:
         """Get vault path as Path object"""
-        return Path(self.config["vault_path"])
+        if self._vault_path is None:
+            self._cache_paths()
+        return self._vault_path
     
     def get_audio_folder(self) -> Path:
         """Get audio folder path"""
-        return self.get_vault_path() / self.config["audio_folder_name"]
+        if self._vault_path is None:
+            self._cache_paths()
+        return self._audio_folder
     
     def get_transcripts_folder(self) -> Path:
         """Get transcripts folder path"""
-        return self.get_vault_path() / self.config["transcripts_folder_name"]
+        if self._vault_path is None:
+            self._cache_paths()
+        return self._transcripts_folder
     
     def load_template(self, template_type: str) -> str:
         """Load template content"""
         template_key = f"{template_type}_template_path"
         template_path = Path(self.config[template_key])
         
-        if not template_path.exists():
-            raise ConfigurationError(f"Template file not found: {template_path}")
-        
         try:
+            # Only re-read the template when it changed on disk
+            key = str(template_path)
+            mtime_ns = template_path.stat().st_mtime_ns
+            cached = self._template_cache.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            
             with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+                content = f.read()
+            self._template_cache[key] = (mtime_ns, content)
+            return content
+        except FileNotFoundError as e:
+            raise ConfigurationError(f"Template file not found: {template_path}") from e
         except Exception as e:
             raise ConfigurationError(f"Error loading template {template_path}: {e}")
     
-    def generate_link_format(self, audio_name: str) -> str:
-        """Generate link format based on configuration"""
+    def _build_link_formatter(self) -> Callable[[str], str]:
+        """Bind the configured link style to a formatter function"""
         link_style = self.config["link_format_style"]
         prefix = self.config["link_format_prefix"]
         
-        if link_style == "wikilink":
+        def wikilink(audio_name: str) -> str:
             return f"{prefix} [[{audio_name}_transcript]]"
-        elif link_style == "standard":
+        
+        def standard(audio_name: str) -> str:
             return f"{prefix} [{audio_name}_transcript]({audio_name}_transcript.md)"
-        else:  # custom
-            # Load custom template
+        
+        if link_style == "wikilink":
+            return wikilink
+        elif link_style == "standard":
+            return standard
+        
+        # custom - load the template once, fall back to wikilink if unavailable
+        try:
+            template = self.load_template("link")
+        except ConfigurationError:
+            return wikilink
+        
+        def custom(audio_name: str) -> str:
             try:
-                template = self.load_template("link")
                 return template.format(audio_name=audio_name)
-            except:
-                # Fallback to wikilink
-                return f"{prefix} [[{audio_name}_transcript]]"
+            except Exception:
+                return wikilink(audio_name)
+        
+        return custom
+    
+    def generate_link_format(self, audio_name: str) -> str:
+        """Generate link format based on configuration"""
+        if self._link_formatter is None:
+            # Memoized per formatter; rebuilding it on config changes starts a fresh cache
+            self._link_formatter = functools.lru_cache(maxsize=1024)(self._build_link_formatter())
+        return self._link_formatter(audio_name)
     
     def save_config(self, config_path: str):
         """Save current configuration to file"""
         config_file = Path(config_path)
         
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                if config_file.suffix.lower() == '.json':
-                    json.dump(self.config, f, indent=2, ensure_ascii=False)
-                elif config_file.suffix.lower() in ['.yaml', '.yml']:
-                    yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True)
-                else:
-                    raise ConfigurationError(f"Unsupported configuration file format: {config_file.suffix}")
+            dumper = _format_handler(_DUMPERS, config_file)
+            atomic_write_bytes(config_file, dumper(self.config))
             
             self.logger.info(f"Configuration saved to {config_path}")
             
@@ -253,19 +541,14 @@ class ConfigManager:
         if config_type not in example_configs:
             raise ConfigurationError(f"Unknown configuration type: {config_type}")
         
-        config = self.DEFAULT_CONFIG.copy()
+        config = dict(self.DEFAULT_CONFIG)
         config.update(example_configs[config_type])
         
         config_file = Path(config_path)
         
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                if config_file.suffix.lower() == '.json':
-                    json.dump(config, f, indent=2, ensure_ascii=False)
-                elif config_file.suffix.lower() in ['.yaml', '.yml']:
-                    yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
-                else:
-                    raise ConfigurationError(f"Unsupported configuration file format: {config_file.suffix}")
+            dumper = _format_handler(_DUMPERS, config_file)
+            atomic_write_bytes(config_file, dumper(config))
             
             self.logger.info(f"Example {config_type} configuration created at {config_path}")
             
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+File helpers shared by the configuration and transcription modules
+"""
+
+import logging
+import os
+import secrets
+import stat
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_bytes(
+    path: Path, payload: bytes, fsync: bool = True, mode: int = 0o666
+):
+    """Write a file with raw os.write calls to a temp file, then swap it into place
+
+    Readers never observe a truncated file. An existing file keeps its
+    permissions and (where allowed) its owner; new files get mode minus the
+    umask. Symlinks are followed so the link itself is preserved.
+    """
+    if path.is_symlink():
+        path = path.resolve()
+    tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+            try:
+                os.chown(tmp_path, st.st_uid, st.st_gid)
+            except PermissionError:
+                logger.warning(
+                    f"Could not preserve owner of {path} "
+                    f"({st.st_uid}:{st.st_gid}) when replacing it"
+                )
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -10,19 +10,107 @@ import re
 import time
 import logging
 from pathlib import Path
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import List, Optional, Dict, Tuple
+from typing import Any, Iterable, Iterator, List, Optional, Dict, Tuple
+import codecs
 import fcntl
+import functools
+import importlib.util
+import itertools
+import multiprocessing
 import shutil
-
-import whisper
+import string
+import subprocess
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import ConfigManager, ConfigurationError
+from .fileio import atomic_write_bytes
+
+# Placeholders available to transcript templates
+TRANSCRIPT_TEMPLATE_FIELDS = frozenset(
+    {"filename", "date", "audio_folder", "transcript_content", "timestamp_content"}
+)
+
+# Templates used when the configured template files can't be loaded
+FALLBACK_TRANSCRIPT_TEMPLATE = """# Transcription: {filename}
+
+**File:** `{filename}`  
+**Date:** {date}  
+**Original Location:** [[{audio_folder}/{filename}]]
+
+## Transcript
+
+{transcript_content}
+
+## Detailed Timestamps
+
+{timestamp_content}"""
+FALLBACK_LINK_TEMPLATE = "📝 **Transcript:** [[{audio_name}_transcript]]"
+
+
+@functools.lru_cache(maxsize=None)
+def _module_available(module_name: str) -> bool:
+    """Check once per process whether a module can be imported, without importing it"""
+    return importlib.util.find_spec(module_name) is not None
+
+
+def _iter_embed_targets(
+    regex: "re.Pattern[bytes]", opener: bytes, content: bytes, pos: int, endpos: int
+) -> Iterator[bytes]:
+    """Yield embed targets matched by regex, including embeds starting inside a match
+
+    Matches don't overlap, so a target containing another embed's opener is
+    searched again from just after its own start (rare; ends within the match).
+    """
+    for match in regex.finditer(content, pos, endpos):
+        yield match.group(1)
+        if opener in match.group(1):
+            yield from _iter_embed_targets(
+                regex, opener, content, match.start() + 1, match.end()
+            )
+
+
+def _find_embed_targets(
+    regex: "re.Pattern[bytes]", opener: bytes, content: bytes, pos: int, endpos: int
+) -> List[bytes]:
+    """List embed targets in content[pos:endpos], rescanning only when matches nest"""
+    targets = regex.findall(content, pos, endpos)
+    if any(opener in target for target in targets):
+        targets = list(_iter_embed_targets(regex, opener, content, pos, endpos))
+    return targets
 
 
 class MarkdownTranscriptionSystem:
     """Universal markdown transcription system that works with any markdown-based note-taking app"""
 
+    # Folders that never contain notes (transcripts folder is added per config)
+    EXCLUDED_NOTE_DIRS = frozenset({".git", ".obsidian"})
+
+    # Note reads kept in flight, and threads reading them, while scanning the vault
+    NOTE_PREFETCH_WINDOW = 64
+    NOTE_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+    # Bytes of note paths passed to a single ripgrep run (within any OS limit)
+    RIPGREP_ARGS_BYTES = 32 * 1024
+
+    # Targets of wikilink (![[target]]) embeds
+    _WIKILINK_TARGET_REGEX = re.compile(rb"!\[\[([^\n]+?)\]\]")
+    # Markdown (![alt](target)) embeds: every "](target)" after an "![" on the
+    # same line, allowing balanced parentheses such as "Recording (1).m4a"
+    _MARKDOWN_EMBED_LINE_REGEX = re.compile(rb"!\[[^\n]*?(\]\([^\n]*)")
+    _MARKDOWN_TARGET_REGEX = re.compile(rb"\]\(((?:[^()\n]|\([^()\n]*\))+)\)")
+
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager
         self.vault_path = self.config.get_vault_path()
@@ -30,6 +118,7 @@ class MarkdownTranscriptionSystem:
         self.transcripts_folder = self.config.get_transcripts_folder()
         self.supported_extensions = self.config.get_supported_extensions()
         self.encoding = self.config.get("encoding")
+        self._cache_config()
 
         # Set up logging
         self.setup_logging()
@@ -43,6 +132,32 @@ class MarkdownTranscriptionSystem:
         # Load Whisper model (lazy loading - only when needed)
         self.whisper_model = None
 
+        # Compiled regexes per audio name (patterns only depend on config)
+        self._embed_regex_cache: Dict[str, "re.Pattern[str]"] = {}
+        self._link_regex_cache: Dict[str, "re.Pattern[str]"] = {}
+
+    def _cache_config(self):
+        """Read config values used in per-file/per-segment loops once"""
+        self._audio_folder_name = self.config.get("audio_folder_name")
+        self._audio_folder_name_lower = self._audio_folder_name.lower()
+        self._transcripts_folder_name = self.config.get("transcripts_folder_name")
+        self._create_timestamps = self.config.get("create_timestamps", True)
+        self._skip_existing = self.config.get("skip_existing_transcripts", True)
+        self._auto_move_files = self.config.get("auto_move_files", True)
+        self._language = self.config.get("language")
+        self._backend = self.config.get("backend", "whisper")
+        self._owner_user = self.config.get("owner_user")
+        self._owner_group = self.config.get("owner_group")
+
+        # Escaped pattern fragments shared by every audio file's regexes
+        self._escaped_exts = [
+            re.escape(ext) for ext in self.config.get_supported_extensions()
+        ]
+        self._escaped_audio_folder = re.escape(self._audio_folder_name)
+        self._escaped_audio_folder_lower = re.escape(
+            self._audio_folder_name_lower
+        )
+
     def setup_logging(self):
         """Set up logging configuration"""
         log_level = getattr(logging, self.config.get("log_level", "INFO"))
@@ -85,22 +200,31 @@ class MarkdownTranscriptionSystem:
         except ConfigurationError as e:
             self.logger.warning(f"Template loading error: {e}")
             # Fall back to basic templates
-            self.transcript_template = """# Transcription: {filename}
+            self.transcript_template = FALLBACK_TRANSCRIPT_TEMPLATE
+            self.link_template = FALLBACK_LINK_TEMPLATE
 
-**File:** `{filename}`  
-**Date:** {date}  
-**Original Location:** [[{audio_folder}/{filename}]]
-
-## Transcript
-
-{transcript_content}
+        # Check the transcript template's placeholders once here, so a bad
+        # template is reported at startup instead of failing every transcript
+        try:
+            fields = {
+                # Base name before any attribute or index access
+                field_name.partition(".")[0].partition("[")[0]
+                for _, field_name, _, _ in string.Formatter().parse(
+                    self.transcript_template
+                )
+                if field_name is not None
+            }
+            invalid_fields = fields - TRANSCRIPT_TEMPLATE_FIELDS
+            if invalid_fields:
+                raise ValueError(
+                    f"unknown placeholders: {', '.join(sorted(invalid_fields))}"
+                )
+        except ValueError as e:
+            self.logger.warning(f"Invalid transcript template: {e}")
+            self.transcript_template = FALLBACK_TRANSCRIPT_TEMPLATE
 
-## Detailed Timestamps
-
-{timestamp_content}"""
-            self.link_template = (
-                "📝 **Transcript:** [[{audio_name}_transcript]]"
-            )
+        # Bound once; rendered for every transcript
+        self._render_transcript = self.transcript_template.format
 
     def acquire_lock(self) -> bool:
         """Acquire file lock to prevent multiple instances"""
@@ -120,49 +244,99 @@ class MarkdownTranscriptionSystem:
 
     def check_dependencies(self) -> bool:
         """Check if required dependencies are installed"""
-        try:
-            # Check if whisper module is available
-            import whisper
-
-            return True
-        except ImportError:
+        if self._backend == "faster-whisper":
+            # Check if faster-whisper module is available
+            if _module_available("faster_whisper"):
+                return True
             self.logger.error(
-                "Whisper is not installed! Install with: uv add openai-whisper"
+                "faster-whisper is not installed! Install with: uv add faster-whisper"
             )
             return False
 
-    def find_media_files(self) -> List[Path]:
+        # Check if whisper module is available
+        if _module_available("whisper"):
+            return True
+        self.logger.error(
+            "Whisper is not installed! Install with: uv add openai-whisper"
+        )
+        return False
+
+    def _walk_vault(
+        self, media: bool = True, notes: bool = True
+    ) -> Iterator[Tuple[Path, bool, bool]]:
+        """Walk the vault once, yielding (path, is_media, is_symlink) for media and notes
+
+        Directories are visited depth-first in scan order. Media below the vault
+        root is only collected with recursive_search; notes are collected
+        everywhere except in transcript and tool folders.
+        """
+        recursive_media = self.config.get("recursive_search", True)
+        excluded_dirs = self.EXCLUDED_NOTE_DIRS | {self._transcripts_folder_name}
+
+        # Directories to visit, with whether to collect media and notes there
+        stack = [(self.vault_path, media, notes)]
+        while stack:
+            directory, want_media, want_notes = stack.pop()
+            subdirectories = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # DirEntry caches file type, so no extra stat per entry
+                        if entry.is_dir(follow_symlinks=False):
+                            # Prune folders neither kind of file is wanted from
+                            sub_media = want_media and recursive_media
+                            sub_notes = want_notes and entry.name not in excluded_dirs
+                            if sub_media or sub_notes:
+                                subdirectories.append(
+                                    (Path(entry.path), sub_media, sub_notes)
+                                )
+                        elif want_notes and entry.name.endswith(".md"):
+                            if not entry.is_dir():
+                                yield Path(entry.path), False, entry.is_symlink()
+                        elif (
+                            want_media
+                            and entry.is_file()
+                            and self.config.is_supported_extension(
+                                os.path.splitext(entry.name)[1]
+                            )
+                        ):
+                            yield Path(entry.path), True, entry.is_symlink()
+            except OSError as e:
+                self.logger.warning(f"Error scanning {directory}: {e}")
+                continue
+
+            stack.extend(reversed(subdirectories))
+
+    def find_media_files(
+        self, candidates: Optional[Iterable[Path]] = None
+    ) -> List[Path]:
         """Find all media files that need transcription"""
         media_files = []
 
-        if self.config.get("recursive_search", True):
-            # Search recursively through all subdirectories
-            search_pattern = "**/*"
-        else:
-            # Search only in vault root
-            search_pattern = "*"
-
-        for file_path in self.vault_path.glob(search_pattern):
-            if (
-                file_path.is_file()
-                and file_path.suffix.lower() in self.supported_extensions
-            ):
-                # Skip files already in the audio folder
-                if file_path.parent == self.audio_folder:
-                    continue
+        # Walk the vault unless the caller already collected the media files
+        if candidates is None:
+            candidates = (path for path, _, _ in self._walk_vault(notes=False))
+
+        # Names of existing transcripts, listed once instead of one exists() per file
+        existing_transcripts = set()
+        if self._skip_existing:
+            try:
+                existing_transcripts = set(os.listdir(self.transcripts_folder))
+            except FileNotFoundError:
+                pass
 
-                # Check if transcript already exists
-                transcript_file = (
-                    self.transcripts_folder / f"{file_path.stem}_transcript.md"
+        for file_path in candidates:
+            # Skip files already in the audio folder
+            if file_path.parent == self.audio_folder:
+                continue
+
+            # Check if transcript already exists
+            if f"{file_path.stem}_transcript.md" not in existing_transcripts:
+                media_files.append(file_path)
+            else:
+                self.logger.info(
+                    f"Skipping {file_path.name} - transcript already exists"
                 )
-                if not transcript_file.exists() or not self.config.get(
-                    "skip_existing_transcripts", True
-                ):
-                    media_files.append(file_path)
-                else:
-                    self.logger.info(
-                        f"Skipping {file_path.name} - transcript already exists"
-                    )
 
         return media_files
 
@@ -171,7 +345,20 @@ class MarkdownTranscriptionSystem:
         if self.whisper_model is None:
             model_name = self.config.get("whisper_model")
             self.logger.info(f"Loading Whisper model: {model_name}")
-            self.whisper_model = whisper.load_model(model_name)
+            if self._backend == "faster-whisper":
+                # CTranslate2 model, int8-quantized by default
+                from faster_whisper import WhisperModel
+
+                self.whisper_model = WhisperModel(
+                    model_name,
+                    device=self.config.get("device", "auto"),
+                    compute_type=self.config.get("compute_type", "int8"),
+                )
+            else:
+                # Imported here so the faster-whisper backend doesn't need torch
+                import whisper
+
+                self.whisper_model = whisper.load_model(model_name)
             self.logger.info("✓ Whisper model loaded successfully")
         return self.whisper_model
 
@@ -183,17 +370,27 @@ class MarkdownTranscriptionSystem:
             # Load Whisper model
             model = self.load_whisper_model()
 
-            # Prepare transcription options
-            transcribe_options = {"verbose": False}
-
-            # Add language parameter if not auto
-            language = self.config.get("language")
-            if language and language != "auto":
-                transcribe_options["language"] = language
+            # Language parameter, None for auto-detection
+            language = self._language
+            if not language or language == "auto":
+                language = None
 
             # Transcribe using Whisper Python API
             self.logger.info(f"Running Whisper transcription...")
-            result = model.transcribe(str(file_path), **transcribe_options)
+            if self._backend == "faster-whisper":
+                # Segments are produced lazily while iterating
+                segments, _ = model.transcribe(str(file_path), language=language)
+                result = {
+                    "segments": [
+                        {"start": segment.start, "text": segment.text}
+                        for segment in segments
+                    ]
+                }
+            else:
+                transcribe_options = {"verbose": False}
+                if language:
+                    transcribe_options["language"] = language
+                result = model.transcribe(str(file_path), **transcribe_options)
 
             # Create markdown transcript directly from result
             success = self.create_markdown_transcript_from_result(
@@ -202,11 +399,11 @@ class MarkdownTranscriptionSystem:
 
             if success:
                 # Move media file to audio folder if configured
-                if self.config.get("auto_move_files", True):
+                if self._auto_move_files:
                     destination = self.audio_folder / file_path.name
                     shutil.move(str(file_path), str(destination))
                     self.logger.info(
-                        f"✓ Moved {file_path.name} to {self.config.get('audio_folder_name')} folder"
+                        f"✓ Moved {file_path.name} to {self._audio_folder_name} folder"
                     )
 
                     # Fix ownership if specified
@@ -220,6 +417,93 @@ class MarkdownTranscriptionSystem:
             self.logger.error(f"Error transcribing {file_path.name}: {e}")
             return False
 
+    def transcribe_files(self, media_files: List[Path]) -> int:
+        """Transcribe a batch of media files with a single loaded model"""
+        workers = min(self.config.get("parallel_workers", 1), len(media_files))
+        if workers > 1:
+            return self.transcribe_files_parallel(media_files, workers)
+
+        # Load the model once up front so a load failure is reported once
+        # instead of being retried (and logged) for every file
+        try:
+            self.load_whisper_model()
+        except Exception as e:
+            self.logger.error(f"Error loading Whisper model: {e}")
+            return 0
+
+        successful_transcriptions = 0
+        for media_file in media_files:
+            if self.transcribe_file(media_file):
+                successful_transcriptions += 1
+
+        return successful_transcriptions
+
+    def transcribe_files_parallel(
+        self, media_files: List[Path], workers: int
+    ) -> int:
+        """Transcribe media files concurrently in separate worker processes"""
+        self.logger.info(f"Transcribing with {workers} parallel workers")
+
+        successful_transcriptions = 0
+        pool_broken = False
+
+        # Each worker process builds its own system and loads its own model;
+        # spawn avoids inheriting torch/CUDA state from this process
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_transcription_worker,
+                initargs=(dict(self.config.config),),
+            ) as executor:
+                futures = {
+                    executor.submit(_transcribe_in_worker, media_file): media_file
+                    for media_file in media_files
+                }
+
+                # Count each file on its own so finished work is still reported
+                # when a worker dies part-way through
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            successful_transcriptions += 1
+                    except BrokenProcessPool as e:
+                        # A dead worker fails every pending file; report it once
+                        if not pool_broken:
+                            self.logger.error(
+                                f"Parallel transcription worker died: {e}"
+                            )
+                            pool_broken = True
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error transcribing {futures[future].name}: {e}"
+                        )
+        except Exception as e:
+            self.logger.error(f"Error in parallel transcription: {e}")
+
+        return successful_transcriptions
+
+    def format_segments(self, segments: List[dict]) -> Tuple[str, str]:
+        """Build the plain transcript and timestamped transcript from Whisper segments"""
+        # Collect lines and join once; repeated str += is quadratic on long transcripts
+        transcript_lines = []
+        timestamp_lines = []
+
+        for segment in segments:
+            text = segment.get("text", "").strip()
+            transcript_lines.append(text)
+
+            if self._create_timestamps:
+                start_time = segment.get("start", 0)
+                minutes = int(start_time // 60)
+                seconds = int(start_time % 60)
+                timestamp_lines.append(f"**[{minutes}:{seconds:02d}]** {text}")
+
+        return (
+            "\n".join(transcript_lines).strip(),
+            "\n".join(timestamp_lines).strip(),
+        )
+
     def create_markdown_transcript_from_result(
         self, result: dict, original_file: Path
     ) -> bool:
@@ -230,31 +514,23 @@ class MarkdownTranscriptionSystem:
             )
 
             # Prepare transcript content
-            transcript_content = ""
-            timestamp_content = ""
-
-            for segment in result.get("segments", []):
-                transcript_content += f"{segment.get('text', '').strip()}\n"
-
-                if self.config.get("create_timestamps", True):
-                    start_time = segment.get("start", 0)
-                    minutes = int(start_time // 60)
-                    seconds = int(start_time % 60)
-                    timestamp = f"**[{minutes}:{seconds:02d}]**"
-                    text = segment.get("text", "").strip()
-                    timestamp_content += f"{timestamp} {text}\n"
+            transcript_content, timestamp_content = self.format_segments(
+                result.get("segments", [])
+            )
 
             # Use template to create final content
-            content = self.transcript_template.format(
+            content = self._render_transcript(
                 filename=original_file.name,
                 date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                audio_folder=self.config.get("audio_folder_name"),
-                transcript_content=transcript_content.strip(),
-                timestamp_content=timestamp_content.strip(),
+                audio_folder=self._audio_folder_name,
+                transcript_content=transcript_content,
+                timestamp_content=timestamp_content,
             )
 
-            with open(transcript_file, "w", encoding=self.encoding) as f:
-                f.write(content)
+            # Swap the finished transcript into place in one atomic rename
+            atomic_write_bytes(
+                transcript_file, content.encode(self.encoding), fsync=False
+            )
 
             # Fix ownership if specified
             self.fix_ownership(transcript_file)
@@ -273,39 +549,32 @@ class MarkdownTranscriptionSystem:
     ) -> bool:
         """Create a markdown transcript from Whisper JSON output using templates (legacy)"""
         try:
-            with open(json_file, "r", encoding=self.encoding) as f:
-                data = json.load(f)
+            # Parse the raw bytes directly (orjson when installed)
+            raw = json_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             transcript_file = (
                 self.transcripts_folder / f"{original_file.stem}_transcript.md"
             )
 
             # Prepare transcript content
-            transcript_content = ""
-            timestamp_content = ""
-
-            for segment in data.get("segments", []):
-                transcript_content += f"{segment.get('text', '').strip()}\n"
-
-                if self.config.get("create_timestamps", True):
-                    start_time = segment.get("start", 0)
-                    minutes = int(start_time // 60)
-                    seconds = int(start_time % 60)
-                    timestamp = f"**[{minutes}:{seconds:02d}]**"
-                    text = segment.get("text", "").strip()
-                    timestamp_content += f"{timestamp} {text}\n"
+            transcript_content, timestamp_content = self.format_segments(
+                data.get("segments", [])
+            )
 
             # Use template to create final content
-            content = self.transcript_template.format(
+            content = self._render_transcript(
                 filename=original_file.name,
                 date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                audio_folder=self.config.get("audio_folder_name"),
-                transcript_content=transcript_content.strip(),
-                timestamp_content=timestamp_content.strip(),
+                audio_folder=self._audio_folder_name,
+                transcript_content=transcript_content,
+                timestamp_content=timestamp_content,
             )
 
-            with open(transcript_file, "w", encoding=self.encoding) as f:
-                f.write(content)
+            # Swap the finished transcript into place in one atomic rename
+            atomic_write_bytes(
+                transcript_file, content.encode(self.encoding), fsync=False
+            )
 
             # Fix ownership if specified
             self.fix_ownership(transcript_file)
@@ -321,8 +590,8 @@ class MarkdownTranscriptionSystem:
 
     def fix_ownership(self, file_path: Path):
         """Fix file ownership using configured user/group"""
-        owner_user = self.config.get("owner_user")
-        owner_group = self.config.get("owner_group")
+        owner_user = self._owner_user
+        owner_group = self._owner_group
 
         if owner_user and owner_group:
             try:
@@ -337,54 +606,93 @@ class MarkdownTranscriptionSystem:
     def generate_audio_embed_patterns(self, audio_name: str) -> List[str]:
         """Generate regex patterns for finding audio embeds based on supported extensions"""
         patterns = []
+        name = re.escape(audio_name)
+        folder = self._escaped_audio_folder
+        folder_lower = self._escaped_audio_folder_lower
 
-        for ext in self.supported_extensions:
-            ext_clean = ext.lstrip(".")
+        for ext in self._escaped_exts:
             # Direct embed pattern
-            patterns.append(
-                rf"!\[\[{re.escape(audio_name)}{re.escape(ext)}\]\]"
-            )
+            patterns.append(rf"!\[\[{name}{ext}\]\]")
             # Folder-prefixed embed pattern (both cases)
-            patterns.append(
-                rf"!\[\[{self.config.get('audio_folder_name').lower()}/{re.escape(audio_name)}{re.escape(ext)}\]\]"
-            )
-            patterns.append(
-                rf"!\[\[{self.config.get('audio_folder_name')}/{re.escape(audio_name)}{re.escape(ext)}\]\]"
-            )
+            patterns.append(rf"!\[\[{folder_lower}/{name}{ext}\]\]")
+            patterns.append(rf"!\[\[{folder}/{name}{ext}\]\]")
 
             # Standard markdown image syntax
-            patterns.append(
-                rf"!\[.*?\]\({re.escape(audio_name)}{re.escape(ext)}\)"
-            )
-            patterns.append(
-                rf"!\[.*?\]\({self.config.get('audio_folder_name')}/{re.escape(audio_name)}{re.escape(ext)}\)"
-            )
+            patterns.append(rf"!\[.*?\]\({name}{ext}\)")
+            patterns.append(rf"!\[.*?\]\({folder}/{name}{ext}\)")
 
         return patterns
 
+    def get_audio_embed_regex(self, audio_name: str) -> "re.Pattern[str]":
+        """Get a single compiled regex matching any embed of an audio file"""
+        regex = self._embed_regex_cache.get(audio_name)
+        if regex is None:
+            patterns = self.generate_audio_embed_patterns(audio_name)
+            regex = re.compile("|".join(patterns), re.IGNORECASE)
+            self._embed_regex_cache[audio_name] = regex
+        return regex
+
+    def _iter_note_files(self) -> Iterator[Path]:
+        """Yield all markdown notes in the vault except transcripts"""
+        for note_file, _, _ in self._walk_vault(media=False):
+            yield note_file
+
+    def _iter_note_contents(
+        self, note_files: Iterable[Path]
+    ) -> Iterator[Tuple[Path, bytes]]:
+        """Yield (note, content) pairs in order, reading ahead on a thread pool
+
+        File reads release the GIL, so up to NOTE_PREFETCH_WINDOW reads are kept
+        in flight on worker threads while the caller scans earlier notes.
+        """
+        note_files = iter(note_files)
+        with ThreadPoolExecutor(max_workers=self.NOTE_READ_WORKERS) as executor:
+            pending = deque(
+                (note_file, executor.submit(note_file.read_bytes))
+                for note_file in itertools.islice(
+                    note_files, self.NOTE_PREFETCH_WINDOW
+                )
+            )
+            while pending:
+                note_file, future = pending.popleft()
+
+                # Keep the read-ahead window full
+                next_file = next(note_files, None)
+                if next_file is not None:
+                    pending.append(
+                        (next_file, executor.submit(next_file.read_bytes))
+                    )
+
+                try:
+                    content = future.result()
+                except OSError as e:
+                    self.logger.warning(f"Error reading {note_file}: {e}")
+                    continue
+
+                yield note_file, content
+
     def find_notes_with_audio(self, audio_name: str) -> List[Path]:
         """Find all notes that contain references to a specific audio file"""
         notes_with_audio = []
-        patterns = self.generate_audio_embed_patterns(audio_name)
+        embed_regex = self.get_audio_embed_regex(audio_name)
 
         # Search through all markdown files in vault
-        for note_file in self.vault_path.rglob("*.md"):
-            # Skip transcript files
-            if note_file.parent.name == self.config.get(
-                "transcripts_folder_name"
-            ):
+        for note_file, content in self._iter_note_contents(
+            self._iter_note_files()
+        ):
+            # Only notes with an embed marker are worth decoding; matching the
+            # decoded text keeps case folding Unicode-aware (e.g. Übung/übung)
+            if b"![" not in content:
                 continue
 
             try:
-                content = note_file.read_text(encoding=self.encoding)
-
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        notes_with_audio.append(note_file)
-                        break
-
-            except Exception as e:
+                text = content.decode(self.encoding)
+            except UnicodeDecodeError as e:
                 self.logger.warning(f"Error reading {note_file}: {e}")
+                continue
+
+            if embed_regex.search(text):
+                notes_with_audio.append(note_file)
 
         return notes_with_audio
 
@@ -397,31 +705,81 @@ class MarkdownTranscriptionSystem:
         # Use configured link format
         transcript_link = self.config.generate_link_format(audio_name)
 
-        # Generate replacements for each supported extension
-        for ext in self.supported_extensions:
-            ext_clean = ext.lstrip(".")
+        name = re.escape(audio_name)
 
+        # Generate replacements for each supported extension
+        for ext in self._escaped_exts:
             # Direct embed patterns
-            pattern = rf"(!\[\[{re.escape(audio_name)}{re.escape(ext)}\]\])"
+            pattern = rf"(!\[\[{name}{ext}\]\])"
             replacement = f"\\1\n\n{transcript_link}"
             replacements.append((pattern, replacement))
 
             # Folder-prefixed patterns
             for folder_variant in [
-                self.config.get("audio_folder_name").lower(),
-                self.config.get("audio_folder_name"),
+                self._escaped_audio_folder_lower,
+                self._escaped_audio_folder,
             ]:
-                pattern = rf"(!\[\[{folder_variant}/{re.escape(audio_name)}{re.escape(ext)}\]\])"
+                pattern = rf"(!\[\[{folder_variant}/{name}{ext}\]\])"
                 replacement = f"\\1\n\n{transcript_link}"
                 replacements.append((pattern, replacement))
 
             # Standard markdown patterns
-            pattern = rf"(!\[.*?\]\({re.escape(audio_name)}{re.escape(ext)}\))"
+            pattern = rf"(!\[.*?\]\({name}{ext}\))"
             replacement = f"\\1\n\n{transcript_link}"
             replacements.append((pattern, replacement))
 
         return replacements
 
+    def get_transcript_link_regex(self, audio_name: str) -> "re.Pattern[str]":
+        """Get a single compiled regex matching any embed a transcript link can follow"""
+        regex = self._link_regex_cache.get(audio_name)
+        if regex is None:
+            patterns = [
+                pattern
+                for pattern, _ in self.generate_transcript_link_replacements(
+                    audio_name
+                )
+            ]
+            regex = re.compile("|".join(patterns), re.IGNORECASE)
+            self._link_regex_cache[audio_name] = regex
+        return regex
+
+    def _write_note(self, note_path: Path, payload: bytes):
+        """Write an updated note, atomically when that keeps the note's identity"""
+        # Replacing a note with a new file would bypass a read-only mode, change
+        # an owner this process can't restore, split hardlinks and drop extended
+        # attributes; such notes are rewritten in place instead (which raises
+        # PermissionError for read-only notes, as a plain write would)
+        st = note_path.stat()
+        euid = os.geteuid()
+        owner_kept = euid == 0 or (
+            st.st_uid == euid
+            and (st.st_gid == os.getegid() or st.st_gid in os.getgroups())
+        )
+        try:
+            has_xattrs = hasattr(os, "listxattr") and bool(
+                os.listxattr(note_path)
+            )
+        except OSError:
+            has_xattrs = False
+
+        if (
+            owner_kept
+            and st.st_nlink == 1
+            and not has_xattrs
+            and os.access(note_path, os.W_OK)
+        ):
+            try:
+                atomic_write_bytes(note_path, payload, fsync=False)
+                return
+            except OSError as e:
+                # e.g. sticky or read-only directories holding a writable note
+                self.logger.debug(
+                    f"Atomic write of {note_path.name} failed, writing in place: {e}"
+                )
+
+        note_path.write_bytes(payload)
+
     def add_transcript_link_to_note(
         self, note_path: Path, audio_name: str
     ) -> bool:
@@ -437,23 +795,16 @@ class MarkdownTranscriptionSystem:
                 )
                 return False
 
-            # Get pattern-replacement pairs
-            patterns_replacements = self.generate_transcript_link_replacements(
-                audio_name
+            # Add the transcript link after the first matching audio embed
+            transcript_link = self.config.generate_link_format(audio_name)
+            content, updated = self.get_transcript_link_regex(audio_name).subn(
+                lambda match: f"{match.group(0)}\n\n{transcript_link}",
+                content,
+                count=1,
             )
 
-            # Try to find and replace audio embed with transcript link
-            updated = False
-            for pattern, replacement in patterns_replacements:
-                if re.search(pattern, content, re.IGNORECASE):
-                    content = re.sub(
-                        pattern, replacement, content, flags=re.IGNORECASE
-                    )
-                    updated = True
-                    break
-
             if updated:
-                note_path.write_text(content, encoding=self.encoding)
+                self._write_note(note_path, content.encode(self.encoding))
                 self.logger.info(
                     f"✓ Added transcript link to {note_path.name}"
                 )
@@ -468,7 +819,175 @@ class MarkdownTranscriptionSystem:
             self.logger.error(f"Error updating {note_path.name}: {e}")
             return False
 
-    def link_transcripts_to_notes(self):
+    def _find_notes_mentioning(
+        self, audio_names: Iterable[str], note_files: List[Path]
+    ) -> Optional[set]:
+        """Ask ripgrep (when installed) which notes mention any of the audio names"""
+        audio_names = list(audio_names)
+        rg = shutil.which("rg")
+        # Names are passed to ripgrep as UTF-8 patterns, one per line
+        if (
+            rg is None
+            or codecs.lookup(self.encoding).name != "utf-8"
+            or any("\n" in audio_name for audio_name in audio_names)
+        ):
+            return None
+
+        command = [
+            rg,
+            "--no-config",
+            "--files-with-matches",
+            "--fixed-strings",
+            "--ignore-case",
+            "--null",
+            "--text",
+            "--encoding",
+            "none",
+            "--file",
+            "-",
+            "--",
+        ]
+        patterns = "\n".join(audio_names).encode("utf-8")
+
+        # The walked notes are passed explicitly, so ripgrep doesn't walk the
+        # vault again; batches keep each command line within OS limits
+        batches, batch, batch_bytes = [], [], 0
+        for note_file in note_files:
+            path = os.fsencode(note_file)
+            if batch and batch_bytes + len(path) > self.RIPGREP_ARGS_BYTES:
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(path)
+            batch_bytes += len(path) + 1
+        if batch:
+            batches.append(batch)
+
+        candidates = set()
+        for batch in batches:
+            try:
+                result = subprocess.run(
+                    command + batch, input=patterns, capture_output=True
+                )
+            except OSError as e:
+                self.logger.debug(
+                    f"ripgrep failed, scanning notes in Python: {e}"
+                )
+                return None
+
+            # Exit code 1 means no matches; anything else is an error
+            if result.returncode not in (0, 1):
+                self.logger.debug(
+                    f"ripgrep exited with {result.returncode}, scanning notes in Python"
+                )
+                return None
+
+            candidates.update(
+                Path(os.fsdecode(path))
+                for path in result.stdout.split(b"\0")
+                if path
+            )
+
+        return candidates
+
+    def _build_audio_index(
+        self,
+        notes: Optional[Iterable[Tuple[Path, bool]]] = None,
+        audio_names: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[Path]]:
+        """Read every note once and map embedded audio names (lowercase) to notes
+
+        Notes are (path, is_symlink) pairs, walking the vault when not given.
+        When audio_names is given, only those names are guaranteed to be indexed,
+        so notes that can't mention any of them may be skipped unread.
+        """
+        audio_folder_name = self._audio_folder_name_lower
+        index: Dict[str, List[Path]] = defaultdict(list)
+
+        if notes is None:
+            notes = (
+                (note_file, is_symlink)
+                for note_file, _, is_symlink in self._walk_vault(media=False)
+            )
+
+        # Let ripgrep rule out notes that don't mention any wanted audio file;
+        # symlinked notes are left to Python, which reads them like any note
+        if audio_names is not None:
+            notes = list(notes)
+            candidates = self._find_notes_mentioning(
+                audio_names,
+                [note_file for note_file, is_symlink in notes if not is_symlink],
+            )
+            if candidates is not None:
+                notes = [
+                    (note_file, is_symlink)
+                    for note_file, is_symlink in notes
+                    if is_symlink or note_file in candidates
+                ]
+        note_files = (note_file for note_file, _ in notes)
+
+        for note_file, content in self._iter_note_contents(note_files):
+            # Notes without any embed marker can skip the regex entirely
+            if b"![" not in content:
+                continue
+
+            targets = _find_embed_targets(
+                self._WIKILINK_TARGET_REGEX, b"![[", content, 0, len(content)
+            )
+            for line in self._MARKDOWN_EMBED_LINE_REGEX.finditer(content):
+                targets.extend(
+                    _find_embed_targets(
+                        self._MARKDOWN_TARGET_REGEX,
+                        b"](",
+                        content,
+                        line.start(1),
+                        line.end(1),
+                    )
+                )
+
+            embedded = set()
+            for target in targets:
+                target = target.decode(self.encoding, errors="replace")
+                # Embeds may point at the file directly or into the audio folder
+                folder, _, filename = target.rpartition("/")
+                if folder and folder.lower() != audio_folder_name:
+                    continue
+
+                stem, ext = os.path.splitext(filename)
+                if stem and self.config.is_supported_extension(ext):
+                    embedded.add(stem.lower())
+
+            for audio_name in embedded:
+                index[audio_name].append(note_file)
+
+        return index
+
+    def _scan_vault(self) -> Tuple[List[Path], Dict[str, List[Path]]]:
+        """Walk the vault once for both media to transcribe and notes to link"""
+        media_candidates, notes = [], []
+        for path, is_media, is_symlink in self._walk_vault():
+            if is_media:
+                media_candidates.append(path)
+            else:
+                notes.append((path, is_symlink))
+
+        media_files = self.find_media_files(media_candidates)
+
+        # Only audio with a transcript (now or after this run) needs linking
+        audio_names = {media_file.stem for media_file in media_files}
+        audio_names.update(
+            transcript_file.stem.replace("_transcript", "")
+            for transcript_file in self.transcripts_folder.glob("*_transcript.md")
+        )
+        if audio_names:
+            audio_index = self._build_audio_index(notes, audio_names)
+        else:
+            audio_index = {}
+
+        return media_files, audio_index
+
+    def link_transcripts_to_notes(
+        self, audio_index: Optional[Dict[str, List[Path]]] = None
+    ):
         """Link all existing transcripts to their corresponding notes"""
         self.logger.info("Linking transcripts to notes...")
 
@@ -477,12 +996,25 @@ class MarkdownTranscriptionSystem:
             self.transcripts_folder.glob("*_transcript.md")
         )
 
+        # Scan the vault once instead of once per transcript
+        if audio_index is None:
+            audio_index = (
+                self._build_audio_index(
+                    audio_names=[
+                        transcript_file.stem.replace("_transcript", "")
+                        for transcript_file in transcript_files
+                    ]
+                )
+                if transcript_files
+                else {}
+            )
+
         for transcript_file in transcript_files:
             # Extract audio name from transcript filename
             audio_name = transcript_file.stem.replace("_transcript", "")
 
             # Find all notes that contain this audio
-            notes_with_audio = self.find_notes_with_audio(audio_name)
+            notes_with_audio = audio_index.get(audio_name.lower(), [])
 
             for note in notes_with_audio:
                 self.add_transcript_link_to_note(note, audio_name)
@@ -512,8 +1044,8 @@ class MarkdownTranscriptionSystem:
                 )
                 return
 
-            # Find media files to transcribe
-            media_files = self.find_media_files()
+            # Find media files to transcribe and index notes in a single walk
+            media_files, audio_index = self._scan_vault()
 
             if not media_files:
                 self.logger.info("No new files to transcribe")
@@ -522,18 +1054,14 @@ class MarkdownTranscriptionSystem:
                     f"Found {len(media_files)} files to transcribe"
                 )
 
-                # Transcribe each file
-                successful_transcriptions = 0
-                for media_file in media_files:
-                    if self.transcribe_file(media_file):
-                        successful_transcriptions += 1
+                successful_transcriptions = self.transcribe_files(media_files)
 
                 self.logger.info(
                     f"Successfully transcribed {successful_transcriptions}/{len(media_files)} files"
                 )
 
             # Link transcripts to notes (both new and existing)
-            self.link_transcripts_to_notes()
+            self.link_transcripts_to_notes(audio_index)
 
             # Fix ownership of directories
             self.fix_ownership(self.audio_folder)
@@ -549,6 +1077,32 @@ class MarkdownTranscriptionSystem:
             self.release_lock()
 
 
+# Per-process system used by transcription pool workers
+_worker_system: Optional[MarkdownTranscriptionSystem] = None
+
+
+def _init_transcription_worker(config: Dict[str, Any]):
+    """Create the transcription system and load its model for a pool worker process"""
+    global _worker_system
+    config_manager = ConfigManager()
+    for key, value in config.items():
+        config_manager.set(key, value)
+    _worker_system = MarkdownTranscriptionSystem(config_manager)
+
+    # Load the model up front so a load failure breaks the pool once
+    # instead of being retried (and logged) for every file
+    try:
+        _worker_system.load_whisper_model()
+    except Exception as e:
+        _worker_system.logger.error(f"Error loading Whisper model: {e}")
+        raise
+
+
+def _transcribe_in_worker(file_path: Path) -> bool:
+    """Transcribe one file in a pool worker process"""
+    return _worker_system.transcribe_file(file_path)
+
+
 def main():
     """Main entry point with configuration support"""
     import argparse
@@ -359,6 +359,78 @@ except Exception as e:
     sys.exit(1)
 "
 
+# Test 11: Embed index test
+print_step "Test 11: Testing embed index against per-file note discovery..."
+cat > test-vault/notes/embed-note.md << 'EOF'
+# Embed Note
+
+![](Audio/Recording (1).m4a)
+![a]b](AUDIO/a(1).wav) and ![[Audio/voice memo.mp3]]
+EOF
+python -c "
+import sys
+sys.path.insert(0, 'src')
+from src.config import ConfigManager
+from src.transcription_system import MarkdownTranscriptionSystem
+
+try:
+    config = ConfigManager('working-config.yaml')
+    system = MarkdownTranscriptionSystem(config)
+
+    # The vault-wide index must agree with per-file discovery
+    index = system._build_audio_index()
+    for audio_name in ['Recording (1)', 'a(1)', 'voice memo', 'test-audio']:
+        indexed = sorted(index.get(audio_name.lower(), []))
+        found = sorted(system.find_notes_with_audio(audio_name))
+        if indexed != found:
+            print(f'❌ Index mismatch for {audio_name}: {indexed} != {found}')
+            sys.exit(1)
+        if audio_name != 'test-audio' and not indexed:
+            print(f'❌ Embed not indexed: {audio_name}')
+            sys.exit(1)
+    print('✅ Embed index matches note discovery')
+
+except Exception as e:
+    print(f'❌ Embed index error: {e}')
+    sys.exit(1)
+"
+
+# Test 12: ripgrep prefilter test
+print_step "Test 12: Testing embed index with and without ripgrep..."
+python -c "
+import os
+import shutil
+import sys
+sys.path.insert(0, 'src')
+from src.config import ConfigManager
+from src.transcription_system import MarkdownTranscriptionSystem
+
+try:
+    config = ConfigManager('working-config.yaml')
+    system = MarkdownTranscriptionSystem(config)
+
+    if shutil.which('rg') is None:
+        print('⚠️  ripgrep is not installed, comparison skipped')
+        sys.exit(0)
+
+    # Hiding ripgrep from PATH makes the index read every note in Python
+    audio_names = ['test-audio', 'Recording (1)', 'a(1)', 'voice memo']
+    with_rg = system._build_audio_index(audio_names=audio_names)
+    os.environ['PATH'] = ''
+    without_rg = system._build_audio_index(audio_names=audio_names)
+
+    for audio_name in audio_names:
+        key = audio_name.lower()
+        if with_rg.get(key, []) != without_rg.get(key, []):
+            print(f'❌ ripgrep index mismatch for {audio_name}')
+            sys.exit(1)
+    print('✅ Embed index is the same with and without ripgrep')
+
+except Exception as e:
+    print(f'❌ ripgrep prefilter error: {e}')
+    sys.exit(1)
+"
+
 # Create a summary report
 print_step "Creating test summary report..."
 cat > test-report.md << EOF
@@ -379,6 +451,8 @@ cat > test-report.md << EOF
 - File discovery
 - Note discovery
 - Safe run test
+- Embed index
+- ripgrep prefilter
 
 ### 📋 System Information
 - Python Version: $(python --version)